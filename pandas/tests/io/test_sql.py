@@ -35,7 +35,6 @@ from pandas import (
     Timestamp,
     concat,
     date_range,
-    isna,
     to_datetime,
     to_timedelta,
 )
@@ -508,6 +507,22 @@ def test_frame3():
     return DataFrame(data, columns=columns)
 
 
+@pytest.fixture
+def test_frame_random():
+    return DataFrame(
+        np.random.default_rng(2).standard_normal((10, 4)),
+        columns=Index(list("ABCD"), dtype=object),
+        index=date_range("2000-01-01", periods=10, freq="B"),
+    )
+
+
+@pytest.fixture
+def test_frame_datetime():
+    return DataFrame(
+        {"A": date_range("2013-01-01 09:00:00", periods=3), "B": np.arange(3.0)}
+    )
+
+
 def get_all_views(conn):
     if isinstance(conn, sqlite3.Connection):
         c = conn.execute("SELECT name FROM sqlite_master WHERE type='view'")
@@ -891,34 +906,41 @@ def sqlite_buildin_types(sqlite_buildin, types_data):
     return sqlite_buildin
 
 
+# The server-backed connectables share one database and drop every table on
+# teardown, so they must not run concurrently. Grouping them per server lets
+# ``pytest -n auto --dist=loadgroup`` keep each server on a single worker while
+# the isolated sqlite connectables are distributed over the remaining ones.
+mysql_marks = [pytest.mark.db, pytest.mark.xdist_group(name="mysql")]
+postgresql_marks = [pytest.mark.db, pytest.mark.xdist_group(name="postgresql")]
+
 mysql_connectable = [
-    pytest.param("mysql_pymysql_engine", marks=pytest.mark.db),
-    pytest.param("mysql_pymysql_conn", marks=pytest.mark.db),
+    pytest.param("mysql_pymysql_engine", marks=mysql_marks),
+    pytest.param("mysql_pymysql_conn", marks=mysql_marks),
 ]
 
 mysql_connectable_iris = [
-    pytest.param("mysql_pymysql_engine_iris", marks=pytest.mark.db),
-    pytest.param("mysql_pymysql_conn_iris", marks=pytest.mark.db),
+    pytest.param("mysql_pymysql_engine_iris", marks=mysql_marks),
+    pytest.param("mysql_pymysql_conn_iris", marks=mysql_marks),
 ]
 
 mysql_connectable_types = [
-    pytest.param("mysql_pymysql_engine_types", marks=pytest.mark.db),
-    pytest.param("mysql_pymysql_conn_types", marks=pytest.mark.db),
+    pytest.param("mysql_pymysql_engine_types", marks=mysql_marks),
+    pytest.param("mysql_pymysql_conn_types", marks=mysql_marks),
 ]
 
 postgresql_connectable = [
-    pytest.param("postgresql_psycopg2_engine", marks=pytest.mark.db),
-    pytest.param("postgresql_psycopg2_conn", marks=pytest.mark.db),
+    pytest.param("postgresql_psycopg2_engine", marks=postgresql_marks),
+    pytest.param("postgresql_psycopg2_conn", marks=postgresql_marks),
 ]
 
 postgresql_connectable_iris = [
-    pytest.param("postgresql_psycopg2_engine_iris", marks=pytest.mark.db),
-    pytest.param("postgresql_psycopg2_conn_iris", marks=pytest.mark.db),
+    pytest.param("postgresql_psycopg2_engine_iris", marks=postgresql_marks),
+    pytest.param("postgresql_psycopg2_conn_iris", marks=postgresql_marks),
 ]
 
 postgresql_connectable_types = [
-    pytest.param("postgresql_psycopg2_engine_types", marks=pytest.mark.db),
-    pytest.param("postgresql_psycopg2_conn_types", marks=pytest.mark.db),
+    pytest.param("postgresql_psycopg2_engine_types", marks=postgresql_marks),
+    pytest.param("postgresql_psycopg2_conn_types", marks=postgresql_marks),
 ]
 
 sqlite_connectable = [
@@ -951,16 +973,16 @@ sqlalchemy_connectable_types = (
 
 adbc_connectable = [
     "sqlite_adbc_conn",
-    pytest.param("postgresql_adbc_conn", marks=pytest.mark.db),
+    pytest.param("postgresql_adbc_conn", marks=postgresql_marks),
 ]
 
 adbc_connectable_iris = [
-    pytest.param("postgresql_adbc_iris", marks=pytest.mark.db),
+    pytest.param("postgresql_adbc_iris", marks=postgresql_marks),
     pytest.param("sqlite_adbc_iris", marks=pytest.mark.db),
 ]
 
 adbc_connectable_types = [
-    pytest.param("postgresql_adbc_types", marks=pytest.mark.db),
+    pytest.param("postgresql_adbc_types", marks=postgresql_marks),
     pytest.param("sqlite_adbc_types", marks=pytest.mark.db),
 ]
 
@@ -1960,7 +1982,8 @@ def test_api_to_sql_index_label(conn, request, index_name, index_label, expected
 
     temp_frame = DataFrame({"col1": range(4)})
     temp_frame.index.name = index_name
-    query = "SELECT * FROM test_index_label"
+    # only the column names are checked, so don't fetch any rows back
+    query = "SELECT * FROM test_index_label WHERE 1 = 0"
     sql.to_sql(temp_frame, "test_index_label", conn, index_label=index_label)
     frame = sql.read_sql_query(query, conn)
     assert frame.columns[0] == expected
@@ -1985,11 +2008,11 @@ def test_api_to_sql_index_label_multiindex(conn, request):
         with sql.SQLDatabase(conn, need_transaction=True) as pandasSQL:
             pandasSQL.drop_table("test_index_label")
 
-    expected_row_count = 4
     temp_frame = DataFrame(
         {"col1": range(4)},
         index=MultiIndex.from_product([("A0", "A1"), ("B0", "B1")]),
     )
+    expected_row_count = len(temp_frame)
 
     # no index name, defaults to 'level_0' and 'level_1'
     result = sql.to_sql(temp_frame, "test_index_label", conn)
@@ -2079,7 +2102,7 @@ def test_api_dtype_argument(conn, request, dtype):
             pandasSQL.drop_table("test_dtype_argument")
 
     df = DataFrame([[1.2, 3.4], [5.6, 7.8]], columns=["A", "B"])
-    assert df.to_sql(name="test_dtype_argument", con=conn) == 2
+    assert df.to_sql(name="test_dtype_argument", con=conn) == len(df)
 
     expected = df.astype(dtype)
 
@@ -2193,9 +2216,7 @@ def test_api_chunksize_read(conn, request):
         with sql.SQLDatabase(conn, need_transaction=True) as pandasSQL:
             pandasSQL.drop_table("test_chunksize")
 
-    df = DataFrame(
-        np.random.default_rng(2).standard_normal((22, 5)), columns=list("abcde")
-    )
+    df = DataFrame(np.arange(110.0).reshape(22, 5), columns=list("abcde"))
     df.to_sql(name="test_chunksize", con=conn, index=False)
 
     # reading the query in one time
@@ -2254,8 +2275,12 @@ def test_api_categorical(conn, request):
             "person_name": ["John P. Doe", "Jane Dove", "John P. Doe"],
         }
     )
-    df2 = df.copy()
-    df2["person_name"] = df2["person_name"].astype("category")
+    df2 = DataFrame(
+        {
+            "person_id": df["person_id"],
+            "person_name": pd.Categorical(df["person_name"]),
+        }
+    )
 
     df2.to_sql(name="test_categorical", con=conn, index=False)
     res = sql.read_sql_query("SELECT * FROM test_categorical", conn)
@@ -2368,13 +2393,15 @@ def test_read_sql_delegate(conn, request):
         )
 
     conn = request.getfixturevalue(conn)
-    iris_frame1 = sql.read_sql_query("SELECT * FROM iris", conn)
-    iris_frame2 = sql.read_sql("SELECT * FROM iris", conn)
-    tm.assert_frame_equal(iris_frame1, iris_frame2)
+    expected = sql.read_sql_query("SELECT * FROM iris", conn)
 
-    iris_frame1 = sql.read_sql_table("iris", conn)
-    iris_frame2 = sql.read_sql("iris", conn)
-    tm.assert_frame_equal(iris_frame1, iris_frame2)
+    result = sql.read_sql("SELECT * FROM iris", conn)
+    tm.assert_frame_equal(result, expected)
+
+    # a bare table name is delegated to read_sql_table, which reads back the
+    # same frame as selecting the whole table
+    result = sql.read_sql("iris", conn)
+    tm.assert_frame_equal(result, expected)
 
 
 def test_not_reflect_all_tables(sqlite_conn):
@@ -2652,7 +2679,7 @@ def test_create_table(conn, request):
 
     temp_frame = DataFrame({"one": [1.0, 2.0, 3.0, 4.0], "two": [4.0, 3.0, 2.0, 1.0]})
     with sql.SQLDatabase(conn, need_transaction=True) as pandasSQL:
-        assert pandasSQL.to_sql(temp_frame, "temp_frame") == 4
+        assert pandasSQL.to_sql(temp_frame, "temp_frame") == len(temp_frame)
 
     insp = inspect(conn)
     assert insp.has_table("temp_frame")
@@ -2674,7 +2701,7 @@ def test_drop_table(conn, request):
     temp_frame = DataFrame({"one": [1.0, 2.0, 3.0, 4.0], "two": [4.0, 3.0, 2.0, 1.0]})
     with sql.SQLDatabase(conn) as pandasSQL:
         with pandasSQL.run_transaction():
-            assert pandasSQL.to_sql(temp_frame, "temp_frame") == 4
+            assert pandasSQL.to_sql(temp_frame, "temp_frame") == len(temp_frame)
 
         insp = inspect(conn)
         assert insp.has_table("temp_frame")
@@ -2773,7 +2800,7 @@ def test_bigint(conn, request):
     # int64 should be converted to BigInteger, GH7433
     conn = request.getfixturevalue(conn)
     df = DataFrame(data={"i64": [2**62]})
-    assert df.to_sql(name="test_bigint", con=conn, index=False) == 1
+    assert df.to_sql(name="test_bigint", con=conn, index=False) == len(df)
     result = sql.read_sql_table("test_bigint", conn)
 
     tm.assert_frame_equal(df, result)
@@ -2858,7 +2885,7 @@ def test_datetime_with_timezone_roundtrip(conn, request):
     if "sqlite" in conn_name:
         # read_sql_query does not return datetime type like read_sql_table
         assert isinstance(result.loc[0, "A"], str)
-        result["A"] = to_datetime(result["A"])
+        result["A"] = to_datetime(result["A"], format="ISO8601")
     tm.assert_frame_equal(result, expected)
 
 
@@ -2919,12 +2946,10 @@ def test_date_parsing(conn, request):
 
 
 @pytest.mark.parametrize("conn", sqlalchemy_connectable)
-def test_datetime(conn, request):
+def test_datetime(conn, request, test_frame_datetime):
     conn_name = conn
     conn = request.getfixturevalue(conn)
-    df = DataFrame(
-        {"A": date_range("2013-01-01 09:00:00", periods=3), "B": np.arange(3.0)}
-    )
+    df = test_frame_datetime
     assert df.to_sql(name="test_datetime", con=conn) == 3
 
     # with read_table -> type information from schema used
@@ -2937,19 +2962,17 @@ def test_datetime(conn, request):
     result = result.drop("index", axis=1)
     if "sqlite" in conn_name:
         assert isinstance(result.loc[0, "A"], str)
-        result["A"] = to_datetime(result["A"])
+        result["A"] = to_datetime(result["A"], format="ISO8601")
         tm.assert_frame_equal(result, df)
     else:
         tm.assert_frame_equal(result, df)
 
 
 @pytest.mark.parametrize("conn", sqlalchemy_connectable)
-def test_datetime_NaT(conn, request):
+def test_datetime_NaT(conn, request, test_frame_datetime):
     conn_name = conn
     conn = request.getfixturevalue(conn)
-    df = DataFrame(
-        {"A": date_range("2013-01-01 09:00:00", periods=3), "B": np.arange(3.0)}
-    )
+    df = test_frame_datetime
     df.loc[1, "A"] = np.nan
     assert df.to_sql(name="test_datetime", con=conn, index=False) == 3
 
@@ -2961,7 +2984,7 @@ def test_datetime_NaT(conn, request):
     result = sql.read_sql_query("SELECT * FROM test_datetime", conn)
     if "sqlite" in conn_name:
         assert isinstance(result.loc[0, "A"], str)
-        result["A"] = to_datetime(result["A"], errors="coerce")
+        result["A"] = to_datetime(result["A"], format="ISO8601", errors="coerce")
         tm.assert_frame_equal(result, df)
     else:
         tm.assert_frame_equal(result, df)
@@ -3001,7 +3024,6 @@ def test_datetime_time(conn, request, sqlite_buildin):
     assert sql.to_sql(df, "test_time3", conn, index=False) == 2
     if "sqlite" in conn_name:
         res = sql.read_sql_query("SELECT * FROM test_time3", conn)
-        ref = df.map(lambda _: _.strftime("%H:%M:%S.%f"))
         tm.assert_frame_equal(ref, res)
     res = sql.read_sql_table("test_time3", conn)
     tm.assert_frame_equal(df, res)
@@ -3096,14 +3118,13 @@ def test_to_sql_save_index(conn, request):
 
     if conn_name in {"sqlite_buildin", "sqlite_str"}:
         ixs = sql.read_sql_query(
-            "SELECT * FROM sqlite_master WHERE type = 'index' "
-            f"AND tbl_name = '{tbl_name}'",
+            "SELECT ix.name AS ix_name, info.name AS col_name "
+            "FROM sqlite_master AS ix, pragma_index_info(ix.name) AS info "
+            f"WHERE ix.type = 'index' AND ix.tbl_name = '{tbl_name}' "
+            "ORDER BY ix.name, info.seqno",
             conn,
         )
-        ix_cols = []
-        for ix_name in ixs.name:
-            ix_info = sql.read_sql_query(f"PRAGMA index_info({ix_name})", conn)
-            ix_cols.append(ix_info.name.tolist())
+        ix_cols = ixs.groupby("ix_name", sort=False)["col_name"].agg(list).tolist()
     else:
         from sqlalchemy import inspect
 
@@ -3214,7 +3235,10 @@ def test_dtype(conn, request):
         TEXT,
         String,
     )
-    from sqlalchemy.schema import MetaData
+    from sqlalchemy.schema import (
+        MetaData,
+        Table,
+    )
 
     cols = ["A", "B"]
     data = [(0.8, True), (0.9, None)]
@@ -3222,8 +3246,7 @@ def test_dtype(conn, request):
     assert df.to_sql(name="dtype_test", con=conn) == 2
     assert df.to_sql(name="dtype_test2", con=conn, dtype={"B": TEXT}) == 2
     meta = MetaData()
-    meta.reflect(bind=conn)
-    sqltype = meta.tables["dtype_test2"].columns["B"].type
+    sqltype = Table("dtype_test2", meta, autoload_with=conn).columns["B"].type
     assert isinstance(sqltype, TEXT)
     msg = "The type of B is not a SQLAlchemy type"
     with pytest.raises(ValueError, match=msg):
@@ -3231,16 +3254,15 @@ def test_dtype(conn, request):
 
     # GH9083
     assert df.to_sql(name="dtype_test3", con=conn, dtype={"B": String(10)}) == 2
-    meta.reflect(bind=conn)
-    sqltype = meta.tables["dtype_test3"].columns["B"].type
+    sqltype = Table("dtype_test3", meta, autoload_with=conn).columns["B"].type
     assert isinstance(sqltype, String)
     assert sqltype.length == 10
 
     # single dtype
     assert df.to_sql(name="single_dtype_test", con=conn, dtype=TEXT) == 2
-    meta.reflect(bind=conn)
-    sqltypea = meta.tables["single_dtype_test"].columns["A"].type
-    sqltypeb = meta.tables["single_dtype_test"].columns["B"].type
+    col_dict = Table("single_dtype_test", meta, autoload_with=conn).columns
+    sqltypea = col_dict["A"].type
+    sqltypeb = col_dict["B"].type
     assert isinstance(sqltypea, TEXT)
     assert isinstance(sqltypeb, TEXT)
 
@@ -3259,7 +3281,10 @@ def test_notna_dtype(conn, request):
         Float,
         Integer,
     )
-    from sqlalchemy.schema import MetaData
+    from sqlalchemy.schema import (
+        MetaData,
+        Table,
+    )
 
     cols = {
         "Bool": Series([True, None]),
@@ -3272,10 +3297,8 @@ def test_notna_dtype(conn, request):
     tbl = "notna_dtype_test"
     assert df.to_sql(name=tbl, con=conn) == 2
     _ = sql.read_sql_table(tbl, conn)
-    meta = MetaData()
-    meta.reflect(bind=conn)
     my_type = Integer if "mysql" in conn_name else Boolean
-    col_dict = meta.tables[tbl].columns
+    col_dict = Table(tbl, MetaData(), autoload_with=conn).columns
     assert isinstance(col_dict["Bool"].type, my_type)
     assert isinstance(col_dict["Date"].type, DateTime)
     assert isinstance(col_dict["Int"].type, Integer)
@@ -3294,7 +3317,10 @@ def test_double_precision(conn, request):
         Float,
         Integer,
     )
-    from sqlalchemy.schema import MetaData
+    from sqlalchemy.schema import (
+        MetaData,
+        Table,
+    )
 
     V = 1.23456789101112131415
 
@@ -3324,9 +3350,7 @@ def test_double_precision(conn, request):
     assert np.round(df["f64"].iloc[0], 14) == np.round(res["f64"].iloc[0], 14)
 
     # check sql types
-    meta = MetaData()
-    meta.reflect(bind=conn)
-    col_dict = meta.tables["test_dtypes"].columns
+    col_dict = Table("test_dtypes", MetaData(), autoload_with=conn).columns
     assert str(col_dict["f32"].type) == str(col_dict["f64_as_f32"].type)
     assert isinstance(col_dict["f32"].type, Float)
     assert isinstance(col_dict["f64"].type, Float)
@@ -3853,6 +3877,7 @@ def test_roundtripping_datetimes_detect_types(sqlite_builtin_detect_types):
 
 
 @pytest.mark.db
+@pytest.mark.xdist_group(name="postgresql")
 def test_psycopg2_schema_support(postgresql_psycopg2_engine):
     conn = postgresql_psycopg2_engine
 
@@ -3924,10 +3949,18 @@ def test_psycopg2_schema_support(postgresql_psycopg2_engine):
         == 2
     )
     res = sql.read_sql_table("test_schema_other", conn, schema="other")
-    tm.assert_frame_equal(concat([df, df], ignore_index=True), res)
+    expected = DataFrame(
+        {
+            "col1": [1, 2, 1, 2],
+            "col2": [0.1, 0.2, 0.1, 0.2],
+            "col3": ["a", "n", "a", "n"],
+        }
+    )
+    tm.assert_frame_equal(res, expected)
 
 
 @pytest.mark.db
+@pytest.mark.xdist_group(name="postgresql")
 def test_self_join_date_columns(postgresql_psycopg2_engine):
     # GH 44421
     conn = postgresql_psycopg2_engine
@@ -4081,35 +4114,12 @@ def test_sqlite_illegal_names(sqlite_buildin):
         assert df.to_sql(name=weird_name, con=conn) == 2
         sql.table_exists(weird_name, conn)
 
-        df2 = DataFrame([[1, 2], [3, 4]], columns=["a", weird_name])
+        df2 = df.set_axis(["a", weird_name], axis=1)
         c_tbl = f"test_weird_col_name{ndx:d}"
         assert df2.to_sql(name=c_tbl, con=conn) == 2
         sql.table_exists(c_tbl, conn)
 
 
-def format_query(sql, *args):
-    _formatters = {
-        datetime: "'{}'".format,
-        str: "'{}'".format,
-        np.str_: "'{}'".format,
-        bytes: "'{}'".format,
-        float: "{:.8f}".format,
-        int: "{:d}".format,
-        type(None): lambda x: "NULL",
-        np.float64: "{:.10f}".format,
-        bool: "'{!s}'".format,
-    }
-    processed_args = []
-    for arg in args:
-        if isinstance(arg, float) and isna(arg):
-            arg = None
-
-        formatter = _formatters[type(arg)]
-        processed_args.append(formatter(arg))
-
-    return sql % tuple(processed_args)
-
-
 def tquery(query, con=None):
     """Replace removed sql.tquery function"""
     with sql.pandasSQL_builder(con) as pandas_sql:
@@ -4117,12 +4127,8 @@ def tquery(query, con=None):
     return None if res is None else list(res)
 
 
-def test_xsqlite_basic(sqlite_buildin):
-    frame = DataFrame(
-        np.random.default_rng(2).standard_normal((10, 4)),
-        columns=Index(list("ABCD"), dtype=object),
-        index=date_range("2000-01-01", periods=10, freq="B"),
-    )
+def test_xsqlite_basic(sqlite_buildin, test_frame_random):
+    frame = test_frame_random
     assert sql.to_sql(frame, name="test_table", con=sqlite_buildin, index=False) == 10
     result = sql.read_sql("select * from test_table", sqlite_buildin)
 
@@ -4144,35 +4150,24 @@ def test_xsqlite_basic(sqlite_buildin):
     tm.assert_frame_equal(expected, result)
 
 
-def test_xsqlite_write_row_by_row(sqlite_buildin):
-    frame = DataFrame(
-        np.random.default_rng(2).standard_normal((10, 4)),
-        columns=Index(list("ABCD"), dtype=object),
-        index=date_range("2000-01-01", periods=10, freq="B"),
-    )
+def test_xsqlite_write_row_by_row(sqlite_buildin, test_frame_random):
+    frame = test_frame_random
     frame.iloc[0, 0] = np.nan
     create_sql = sql.get_schema(frame, "test")
     cur = sqlite_buildin.cursor()
     cur.execute(create_sql)
 
-    ins = "INSERT INTO test VALUES (%s, %s, %s, %s)"
-    for _, row in frame.iterrows():
-        fmt_sql = format_query(ins, *row)
-        tquery(fmt_sql, con=sqlite_buildin)
-
-    sqlite_buildin.commit()
+    ins = "INSERT INTO test VALUES (?, ?, ?, ?)"
+    with sqlite_buildin:
+        cur.executemany(ins, frame.itertuples(index=False, name=None))
 
     result = sql.read_sql("select * from test", con=sqlite_buildin)
     result.index = frame.index
-    tm.assert_frame_equal(result, frame, rtol=1e-3)
+    tm.assert_frame_equal(result, frame)
 
 
-def test_xsqlite_execute(sqlite_buildin):
-    frame = DataFrame(
-        np.random.default_rng(2).standard_normal((10, 4)),
-        columns=Index(list("ABCD"), dtype=object),
-        index=date_range("2000-01-01", periods=10, freq="B"),
-    )
+def test_xsqlite_execute(sqlite_buildin, test_frame_random):
+    frame = test_frame_random
     create_sql = sql.get_schema(frame, "test")
     cur = sqlite_buildin.cursor()
     cur.execute(create_sql)
@@ -4188,12 +4183,8 @@ def test_xsqlite_execute(sqlite_buildin):
     tm.assert_frame_equal(result, frame[:1])
 
 
-def test_xsqlite_schema(sqlite_buildin):
-    frame = DataFrame(
-        np.random.default_rng(2).standard_normal((10, 4)),
-        columns=Index(list("ABCD"), dtype=object),
-        index=date_range("2000-01-01", periods=10, freq="B"),
-    )
+def test_xsqlite_schema(sqlite_buildin, test_frame_random):
+    frame = test_frame_random
     create_sql = sql.get_schema(frame, "test")
     lines = create_sql.splitlines()
     for line in lines:
@@ -4272,23 +4263,23 @@ def test_xsqlite_onecolumn_of_integer(sqlite_buildin):
     tm.assert_frame_equal(result, mono_df)
 
 
-def test_xsqlite_if_exists(sqlite_buildin):
+def test_xsqlite_if_exists_invalid(sqlite_buildin):
     df_if_exists_1 = DataFrame({"col1": [1, 2], "col2": ["A", "B"]})
-    df_if_exists_2 = DataFrame({"col1": [3, 4, 5], "col2": ["C", "D", "E"]})
-    table_name = "table_if_exists"
-    sql_select = f"SELECT * FROM {table_name}"
 
     msg = "'notvalidvalue' is not valid for if_exists"
     with pytest.raises(ValueError, match=msg):
         sql.to_sql(
             frame=df_if_exists_1,
             con=sqlite_buildin,
-            name=table_name,
+            name="table_if_exists",
             if_exists="notvalidvalue",
         )
-    drop_table(table_name, sqlite_buildin)
 
-    # test if_exists='fail'
+
+def test_xsqlite_if_exists_fail(sqlite_buildin):
+    df_if_exists_1 = DataFrame({"col1": [1, 2], "col2": ["A", "B"]})
+    table_name = "table_if_exists"
+
     sql.to_sql(
         frame=df_if_exists_1, con=sqlite_buildin, name=table_name, if_exists="fail"
     )
@@ -4300,7 +4291,17 @@ def test_xsqlite_if_exists(sqlite_buildin):
             name=table_name,
             if_exists="fail",
         )
-    # test if_exists='replace'
+
+
+def test_xsqlite_if_exists_replace(sqlite_buildin):
+    df_if_exists_1 = DataFrame({"col1": [1, 2], "col2": ["A", "B"]})
+    df_if_exists_2 = DataFrame({"col1": [3, 4, 5], "col2": ["C", "D", "E"]})
+    table_name = "table_if_exists"
+    sql_select = f"SELECT * FROM {table_name}"
+
+    sql.to_sql(
+        frame=df_if_exists_1, con=sqlite_buildin, name=table_name, if_exists="fail"
+    )
     sql.to_sql(
         frame=df_if_exists_1,
         con=sqlite_buildin,
@@ -4320,9 +4321,14 @@ def test_xsqlite_if_exists(sqlite_buildin):
         == 3
     )
     assert tquery(sql_select, con=sqlite_buildin) == [(3, "C"), (4, "D"), (5, "E")]
-    drop_table(table_name, sqlite_buildin)
 
-    # test if_exists='append'
+
+def test_xsqlite_if_exists_append(sqlite_buildin):
+    df_if_exists_1 = DataFrame({"col1": [1, 2], "col2": ["A", "B"]})
+    df_if_exists_2 = DataFrame({"col1": [3, 4, 5], "col2": ["C", "D", "E"]})
+    table_name = "table_if_exists"
+    sql_select = f"SELECT * FROM {table_name}"
+
     assert (
         sql.to_sql(
             frame=df_if_exists_1,
@@ -4351,4 +4357,3 @@ def test_xsqlite_if_exists(sqlite_buildin):
         (4, "D"),
         (5, "E"),
     ]
-    drop_table(table_name, sqlite_buildin)
@@ -226,7 +226,12 @@ def test_resample_empty_series(freq, index, resample_method):
 @pytest.mark.parametrize(
     "freq",
     [
-        pytest.param("ME", marks=pytest.mark.xfail(reason="Don't know why this fails")),
+        pytest.param(
+            "ME",
+            marks=pytest.mark.xfail(
+                reason="ME is not a valid period frequency", raises=ValueError
+            ),
+        ),
         "D",
         "h",
     ],
@@ -325,8 +330,6 @@ def test_resample_empty_dataframe(index, freq, resample_method):
         # TODO: no tests with len(df.columns) > 0
         mi = MultiIndex.from_product([df.columns, ["open", "high", "low", "close"]])
         expected = DataFrame([], index=df.index[:0], columns=mi, dtype=np.float64)
-        expected.index = _asfreq_compat(df.index, freq)
-
     elif resample_method != "size":
         expected = df.copy()
     else:
@@ -508,9 +511,11 @@ def test_resampler_is_iterable(index):
 
     with tm.assert_produces_warning(warn, match=msg):
         resampled = series.resample(freq)
-    for (rk, rv), (gk, gv) in zip(resampled, grouped):
-        assert rk == gk
-        tm.assert_series_equal(rv, gv)
+    result = dict(iter(resampled))
+    expected = dict(iter(grouped))
+    assert list(result) == list(expected)
+    for key, exp in expected.items():
+        tm.assert_series_equal(result[key], exp)
 
 
 @pytest.mark.parametrize(
@@ -366,24 +366,22 @@ class TestFreqConversion:
         with pytest.raises(ValueError, match=msg):
             ival_W.asfreq("WK")
 
-    def test_conv_weekly_legacy(self):
+    @pytest.mark.parametrize(
+        "freq, day",
+        [
+            ("WK", 1),
+            ("WK-SAT", 6),
+            ("WK-FRI", 5),
+            ("WK-THU", 4),
+            ("WK-WED", 3),
+            ("WK-TUE", 2),
+            ("WK-MON", 1),
+        ],
+    )
+    def test_conv_weekly_legacy(self, freq, day):
         # frequency conversion tests: from Weekly Frequency
-        msg = INVALID_FREQ_ERR_MSG
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK", year=2007, month=1, day=1)
-
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-SAT", year=2007, month=1, day=6)
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-FRI", year=2007, month=1, day=5)
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-THU", year=2007, month=1, day=4)
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-WED", year=2007, month=1, day=3)
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-TUE", year=2007, month=1, day=2)
-        with pytest.raises(ValueError, match=msg):
-            Period(freq="WK-MON", year=2007, month=1, day=1)
+        with pytest.raises(ValueError, match=INVALID_FREQ_ERR_MSG):
+            Period(freq=freq, year=2007, month=1, day=day)
 
     def test_conv_business(self):
         # frequency conversion tests: from Business Frequency"
@@ -706,114 +704,73 @@ class TestFreqConversion:
         with pytest.raises(OutOfBoundsDatetime, match=msg):
             per2.end_time
 
-    def test_asfreq_mult(self):
-        # normal freq to mult freq
-        p = Period(freq="Y", year=2007)
-        # ordinal will not change
-        for freq in ["3Y", offsets.YearEnd(3)]:
-            result = p.asfreq(freq)
-            expected = Period("2007", freq="3Y")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-        # ordinal will not change
-        for freq in ["3Y", offsets.YearEnd(3)]:
-            result = p.asfreq(freq, how="S")
-            expected = Period("2007", freq="3Y")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-
-        # mult freq to normal freq
-        p = Period(freq="3Y", year=2007)
-        # ordinal will change because how=E is the default
-        for freq in ["Y", offsets.YearEnd()]:
-            result = p.asfreq(freq)
-            expected = Period("2009", freq="Y")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-        # ordinal will not change
-        for freq in ["Y", offsets.YearEnd()]:
-            result = p.asfreq(freq, how="s")
-            expected = Period("2007", freq="Y")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-
-        p = Period(freq="Y", year=2007)
-        for freq in ["2M", offsets.MonthEnd(2)]:
-            result = p.asfreq(freq)
-            expected = Period("2007-12", freq="2M")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-        for freq in ["2M", offsets.MonthEnd(2)]:
-            result = p.asfreq(freq, how="s")
-            expected = Period("2007-01", freq="2M")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-
-        p = Period(freq="3Y", year=2007)
-        for freq in ["2M", offsets.MonthEnd(2)]:
-            result = p.asfreq(freq)
-            expected = Period("2009-12", freq="2M")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-        for freq in ["2M", offsets.MonthEnd(2)]:
-            result = p.asfreq(freq, how="s")
-            expected = Period("2007-01", freq="2M")
-
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-
-    def test_asfreq_combined(self):
+    @pytest.mark.parametrize(
+        "src_freq, freq, kwargs, expected",
+        [
+            # normal freq to mult freq, ordinal will not change
+            ("Y", "3Y", {}, ("2007", "3Y")),
+            ("Y", offsets.YearEnd(3), {}, ("2007", "3Y")),
+            ("Y", "3Y", {"how": "S"}, ("2007", "3Y")),
+            ("Y", offsets.YearEnd(3), {"how": "S"}, ("2007", "3Y")),
+            # mult freq to normal freq, ordinal will change because how=E is
+            # the default
+            ("3Y", "Y", {}, ("2009", "Y")),
+            ("3Y", offsets.YearEnd(), {}, ("2009", "Y")),
+            # ordinal will not change
+            ("3Y", "Y", {"how": "s"}, ("2007", "Y")),
+            ("3Y", offsets.YearEnd(), {"how": "s"}, ("2007", "Y")),
+            # normal freq to a mult freq of a different unit
+            ("Y", "2M", {}, ("2007-12", "2M")),
+            ("Y", offsets.MonthEnd(2), {}, ("2007-12", "2M")),
+            ("Y", "2M", {"how": "s"}, ("2007-01", "2M")),
+            ("Y", offsets.MonthEnd(2), {"how": "s"}, ("2007-01", "2M")),
+            # mult freq to mult freq
+            ("3Y", "2M", {}, ("2009-12", "2M")),
+            ("3Y", offsets.MonthEnd(2), {}, ("2009-12", "2M")),
+            ("3Y", "2M", {"how": "s"}, ("2007-01", "2M")),
+            ("3Y", offsets.MonthEnd(2), {"how": "s"}, ("2007-01", "2M")),
+        ],
+    )
+    def test_asfreq_mult(self, src_freq, freq, kwargs, expected):
+        p = Period(freq=src_freq, year=2007)
+        result = p.asfreq(freq, **kwargs)
+        expected = Period(*expected)
+
+        assert result == expected
+        assert result.ordinal == expected.ordinal
+        assert result.freq == expected.freq
+
+    @pytest.mark.parametrize("freq, how", [("1D1h", "E"), ("1h1D", "S")])
+    def test_asfreq_combined(self, freq, how):
         # normal freq to combined freq
         p = Period("2007", freq="h")
 
         # ordinal will not change
         expected = Period("2007", freq="25h")
-        for freq, how in zip(["1D1h", "1h1D"], ["E", "S"]):
-            result = p.asfreq(freq, how=how)
-            assert result == expected
-            assert result.ordinal == expected.ordinal
-            assert result.freq == expected.freq
-
+        result = p.asfreq(freq, how=how)
+        assert result == expected
+        assert result.ordinal == expected.ordinal
+        assert result.freq == expected.freq
+
+    @pytest.mark.parametrize("freq", ["1D1h", "1h1D"])
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            # ordinal will change because how=E is the default
+            ({}, "2007-01-02"),
+            # ordinal will not change
+            ({"how": "S"}, "2007-01-01"),
+        ],
+    )
+    def test_asfreq_combined_to_normal(self, freq, kwargs, expected):
         # combined freq to normal freq
-        p1 = Period(freq="1D1h", year=2007)
-        p2 = Period(freq="1h1D", year=2007)
-
-        # ordinal will change because how=E is the default
-        result1 = p1.asfreq("h")
-        result2 = p2.asfreq("h")
-        expected = Period("2007-01-02", freq="h")
-        assert result1 == expected
-        assert result1.ordinal == expected.ordinal
-        assert result1.freq == expected.freq
-        assert result2 == expected
-        assert result2.ordinal == expected.ordinal
-        assert result2.freq == expected.freq
+        p = Period(freq=freq, year=2007)
 
-        # ordinal will not change
-        result1 = p1.asfreq("h", how="S")
-        result2 = p2.asfreq("h", how="S")
-        expected = Period("2007-01-01", freq="h")
-        assert result1 == expected
-        assert result1.ordinal == expected.ordinal
-        assert result1.freq == expected.freq
-        assert result2 == expected
-        assert result2.ordinal == expected.ordinal
-        assert result2.freq == expected.freq
+        result = p.asfreq("h", **kwargs)
+        expected = Period(expected, freq="h")
+        assert result == expected
+        assert result.ordinal == expected.ordinal
+        assert result.freq == expected.freq
 
     def test_asfreq_MS(self):
         initial = Period("2013")
@@ -32,7 +32,7 @@ from pandas.tseries.offsets import (
 )
 def test_apply_index(cls, n):
     offset = cls(n=n)
-    rng = pd.date_range(start="1/1/2000", periods=100000, freq="min")
+    rng = pd.date_range(start="1/1/2000", periods=1000, freq="100min")
     ser = pd.Series(rng)
 
     res = rng + offset
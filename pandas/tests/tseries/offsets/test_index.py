@@ -45,7 +45,7 @@ from pandas.tseries.offsets import (
 )
 def test_apply_index(cls, n):
     offset = cls(n=n)
-    rng = date_range(start="1/1/2000", periods=100000, freq="min")
+    rng = date_range(start="1/1/2000", periods=1000, freq="100min")
     ser = Series(rng)
 
     res = rng + offset
@@ -25,10 +25,36 @@ def _compare_utc_to_local(tz_didx):
     def f(x):
         return tzconversion.tz_convert_from_utc_single(x, tz_didx.tz)
 
-    result = tz_convert_from_utc(tz_didx.asi8, tz_didx.tz)
-    expected = np.vectorize(f)(tz_didx.asi8)
-
-    tm.assert_numpy_array_equal(result, expected)
+    values = tz_didx.asi8
+    result = tz_convert_from_utc(values, tz_didx.tz)
+
+    def offset(i):
+        return f(values[i]) - values[i]
+
+    # The UTC offset is piecewise constant, so compare pointwise on both
+    # sides of every offset change plus an evenly spaced sample. The changes
+    # are located with the pointwise reference, bisecting between sample
+    # points whose offsets differ, and the changes seen in ``result`` are
+    # added so that spurious ones are checked as well.
+    sample = np.linspace(0, len(values) - 1, num=64, dtype=np.intp)
+    bounds = []
+    for lo, hi in zip(sample[:-1], sample[1:]):
+        if offset(lo) == offset(hi):
+            continue
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if offset(mid) == offset(lo):
+                lo = mid
+            else:
+                hi = mid
+        bounds.extend([lo, hi])
+    changes = np.flatnonzero(np.diff(result - values))
+    positions = np.unique(
+        np.concatenate([sample, np.array(bounds, dtype=np.intp), changes, changes + 1])
+    )
+    expected = np.array([f(x) for x in values[positions]], dtype=np.int64)
+
+    tm.assert_numpy_array_equal(result[positions], expected)
 
 
 def _compare_local_to_utc(tz_didx, naive_didx):
@@ -26,6 +26,7 @@ For more information, refer to the ``pytest`` documentation on ``skipif``.
 
 from __future__ import annotations
 
+import functools
 import locale
 from typing import (
     TYPE_CHECKING,
@@ -44,6 +45,14 @@ from pandas.compat import (
 from pandas.compat._optional import import_optional_dependency
 
 
+@functools.cache
+def _is_importable(package: str, min_version: str | None = None) -> bool:
+    # Many test modules probe the same packages; import each one only once.
+    return bool(
+        import_optional_dependency(package, errors="ignore", min_version=min_version)
+    )
+
+
 def skip_if_installed(package: str) -> pytest.MarkDecorator:
     """
     Skip a test if a package is installed.
@@ -60,7 +69,7 @@ def skip_if_installed(package: str) -> pytest.MarkDecorator:
         parametrization mark.
     """
     return pytest.mark.skipif(
-        bool(import_optional_dependency(package, errors="ignore")),
+        _is_importable(package),
         reason=f"Skipping because {package} is installed.",
     )
 
@@ -100,20 +109,17 @@ def skip_if_no(package: str, min_version: str | None = None) -> pytest.MarkDecor
     if min_version:
         msg += f" satisfying a min_version of {min_version}"
     return pytest.mark.skipif(
-        not bool(
-            import_optional_dependency(
-                package, errors="ignore", min_version=min_version
-            )
-        ),
+        not _is_importable(package, min_version),
         reason=msg,
     )
 
 
 skip_if_32bit = pytest.mark.skipif(not IS64, reason="skipping for 32 bit")
 skip_if_windows = pytest.mark.skipif(is_platform_windows(), reason="Running on Windows")
+_current_locale = locale.getlocale()[0]
 skip_if_not_us_locale = pytest.mark.skipif(
-    locale.getlocale()[0] != "en_US",
-    reason=f"Set local {locale.getlocale()[0]} is not en_US",
+    _current_locale != "en_US",
+    reason=f"Set local {_current_locale} is not en_US",
 )
 
 